@@ -8,10 +8,11 @@ print("\n=== Metaprogramming ===")
 # Basic Metaclass
 class MetaLogger(type):
     def __new__(cls, name, bases, attrs):
-        print(f"\nCreating class: {name}")
-        for key, value in attrs.items():
-            if not key.startswith('__'):
-                print(f"Attribute: {key} = {value}")
+        lines = [f"\nCreating class: {name}"]
+        lines.extend(f"Attribute: {key} = {value}"
+                     for key, value in attrs.items()
+                     if not key.startswith('__'))
+        print("\n".join(lines))  # One print call per class
         return super().__new__(cls, name, bases, attrs)
 
 # Metaclass with Method Interception
@@ -24,35 +25,60 @@ class MetaValidator(type):
     
     @staticmethod
     def validate_types(func):
+        # Read annotations once at class creation, not on every call
+        checks = tuple(getattr(func, '__annotations__', {}).items())
+        if not checks:
+            return func
         def wrapper(*args, **kwargs):
-            # Validate types using annotations
-            for arg, value in zip(func.__annotations__, args[1:]):
-                if not isinstance(value, func.__annotations__[arg]):
-                    raise TypeError(f"Argument {arg} must be {func.__annotations__[arg]}")
+            for (arg, type_), value in zip(checks, args[1:]):
+                if not isinstance(value, type_):
+                    raise TypeError(f"Argument {arg} must be {type_}")
             return func(*args, **kwargs)
         return wrapper
 
 # Class Factory
+import keyword
+
 def create_dataclass(class_name, **fields):
-    return type(class_name, (), {
-        '__init__': lambda self, **kwargs: setattr(self, '__dict__', kwargs),
-        '__repr__': lambda self: f"{class_name}({', '.join(f'{k}={v!r}' for k, v in self.__dict__.items())})",
-        **fields
-    })
+    # Generate source specialized to the field names, then exec it.
+    # Field values become __init__ defaults; on the class itself each
+    # field is a slot descriptor, so Point.x no longer returns the default.
+    for label in (class_name, *fields):
+        if not label.isidentifier() or keyword.iskeyword(label) or label == 'self':
+            raise ValueError(f"Invalid class or field name: {label!r}")
+    names = tuple(fields)
+    params = ''.join(f", {n}=_defaults[{n!r}]" for n in names)
+    body = ''.join(f"\n        self.{n} = {n}" for n in names) or "\n        pass"
+    fmt = ', '.join(f"{n}={{self.{n}!r}}" for n in names)
+    source = (
+        f"class {class_name}:\n"
+        f"    __slots__ = {names!r}\n"
+        f"    def __init__(self{params}):{body}\n"
+        f"    def __repr__(self):\n"
+        f"        return f'{class_name}({fmt})'\n"
+    )
+    namespace = {'_defaults': fields, '__name__': __name__}
+    exec(source, namespace)
+    return namespace[class_name]
 
 # -----------------------------
 # 2. DESCRIPTOR PATTERNS
 # -----------------------------
 print("\n=== Descriptor Patterns ===")
 
+import sys
+
 # Data Descriptor
 class ValidatedField:
+    __slots__ = ('validators', 'name', '_validate')
+    
     def __init__(self, *validators):
         self.validators = validators
         self.name = None
+        self._validate = self._combine(validators)
     
     def __set_name__(self, owner, name):
-        self.name = name
+        self.name = sys.intern(name)  # Interned keys hit dict fast paths
     
     def __get__(self, instance, owner):
         if instance is None:
@@ -60,9 +86,30 @@ class ValidatedField:
         return instance.__dict__.get(self.name)
     
     def __set__(self, instance, value):
-        for validator in self.validators:
-            validator(value)
+        self._validate(value)
         instance.__dict__[self.name] = value
+    
+    @staticmethod
+    def _combine(validators):
+        # Unroll the chain into one generated function: no loop per assignment
+        if not validators:
+            return ValidatedField._accept
+        if len(validators) == 1:
+            return validators[0]
+        params = ', '.join(f"v{i}" for i in range(len(validators)))
+        calls = ''.join(f"\n        v{i}(value)" for i in range(len(validators)))
+        source = (
+            f"def make({params}):\n"
+            f"    def validate(value):{calls}\n"
+            f"    return validate\n"
+        )
+        namespace = {}
+        exec(source, namespace)
+        return namespace['make'](*validators)
+    
+    @staticmethod
+    def _accept(value):
+        pass
 
 # Validators
 def min_length(min_len):
@@ -79,8 +126,9 @@ def max_length(max_len):
 
 def pattern(regex):
     import re
+    compiled = re.compile(regex)  # Compile once per validator
     def validate(value):
-        if not re.match(regex, value):
+        if not compiled.match(value):
             raise ValueError(f"Value must match pattern {regex}")
     return validate
 
@@ -103,6 +151,9 @@ class Stringable(Protocol):
     def __str__(self) -> str: ...
 
 class Container(Generic[T]):
+    # No per-instance __dict__; keep typing's runtime parameter and weakrefs
+    __slots__ = ('item', '__orig_class__', '__weakref__')
+    
     def __init__(self, item: T):
         self.item = item
     
@@ -165,6 +216,15 @@ class AsyncRange:
         await asyncio.sleep(0.1)
         self.start += 1
         return self.start - 1
+    
+    async def iter_chunks(self, size: int) -> AsyncIterator[list[int]]:
+        # One await per chunk instead of per element
+        if size < 1:
+            raise ValueError("Chunk size must be at least 1")
+        while self.start < self.stop:
+            await asyncio.sleep(0.1)
+            start, self.start = self.start, min(self.start + size, self.stop)
+            yield list(range(start, self.start))
 
 # Async Generator
 async def async_generator(n: int) -> AsyncIterator[int]:
@@ -172,6 +232,23 @@ async def async_generator(n: int) -> AsyncIterator[int]:
         await asyncio.sleep(0.1)
         yield i
 
+# Eager Task Execution (3.12+)
+async def lookup(key: str) -> str:
+    return key.upper()  # Finishes without suspending
+
+async def main():
+    return await asyncio.gather(lookup("a"), lookup("b"))
+
+def run_eager(coro):
+    loop = asyncio.new_event_loop()
+    if hasattr(asyncio, "eager_task_factory"):
+        # Tasks run synchronously until their first await
+        loop.set_task_factory(asyncio.eager_task_factory)
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
 # -----------------------------
 # 5. MEMORY MANAGEMENT
 # -----------------------------
@@ -179,21 +256,23 @@ print("\n=== Memory Management ===")
 
 import weakref
 import gc
-from contextlib import suppress
+from collections import Counter
 
 # Custom Reference Counting
 class RefCounted:
-    _instances = {}
+    _instances = Counter()
     
     def __init__(self, name):
         self.name = name
-        self.__class__._instances[name] = self.__class__._instances.get(name, 0) + 1
+        self._instances[name] += 1
     
     def __del__(self):
-        with suppress(KeyError):
-            self.__class__._instances[self.name] -= 1
-            if self.__class__._instances[self.name] == 0:
-                del self.__class__._instances[self.name]
+        instances = self._instances
+        remaining = instances.get(self.name, 0) - 1
+        if remaining > 0:
+            instances[self.name] = remaining
+        else:
+            instances.pop(self.name, None)
 
 # Weak References
 class Cache:
@@ -211,14 +290,20 @@ class MemoryTracker:
     def __init__(self):
         self.start_stats = None
     
+    @staticmethod
+    def _snapshot():
+        # (collections, collected) per generation, as plain ints
+        return tuple((gen['collections'], gen['collected'])
+                     for gen in gc.get_stats())
+    
     def __enter__(self):
         gc.collect()
-        self.start_stats = gc.get_stats()
+        self.start_stats = self._snapshot()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         gc.collect()
-        end_stats = gc.get_stats()
+        end_stats = self._snapshot()
         for i, (start, end) in enumerate(zip(self.start_stats, end_stats)):
             print(f"Generation {i}:")
             print(f"  Collections: {end[0] - start[0]}")
@@ -240,11 +325,13 @@ class Singleton:
     _lock = threading.Lock()
     
     def __new__(cls):
-        if cls._instance is None:
+        instance = cls._instance  # Fast path: one lookup, no lock
+        if instance is None:
             with cls._lock:
                 if cls._instance is None:
                     cls._instance = super().__new__(cls)
-        return cls._instance
+                instance = cls._instance
+        return instance
 
 # Producer-Consumer Pattern
 class ProducerConsumer:
@@ -312,7 +399,8 @@ class DynamicContext:
 @contextmanager
 def nested_contexts(*managers):
     with ExitStack() as stack:
-        yield tuple(stack.enter_context(mgr) for mgr in managers)
+        entered = [stack.enter_context(mgr) for mgr in managers]
+        yield tuple(entered)
 
 # -----------------------------
 # 8. ADVANCED INTROSPECTION
@@ -326,12 +414,14 @@ import sys
 class Inspector:
     @classmethod
     def inspect_class(cls, target_class):
-        # Get all members
+        # Get all members (one MRO walk)
         members = inspect.getmembers(target_class)
         
         # Categorize members
-        methods = inspect.getmembers(target_class, predicate=inspect.isfunction)
-        properties = inspect.getmembers(target_class, predicate=inspect.isdatadescriptor)
+        methods = [(name, value) for name, value in members
+                   if inspect.isfunction(value)]
+        properties = [(name, value) for name, value in members
+                      if inspect.isdatadescriptor(value)]
         attributes = {name: value for name, value in members 
                      if not name.startswith('__') 
                      and not inspect.isfunction(value)
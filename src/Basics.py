@@ -283,11 +283,11 @@ def validate_age(age):
 print("\n=== Comprehensions ===")
 
 # List Comprehension
-squares = [x**2 for x in range(5)]
+squares = [x * x for x in range(5)]
 print(f"Squares: {squares}")
 
 # Dictionary Comprehension
-square_dict = {x: x**2 for x in range(5)}
+square_dict = {x: x * x for x in range(5)}
 print(f"Square dict: {square_dict}")
 
 # Set Comprehension
@@ -295,5 +295,5 @@ even_set = {x for x in range(10) if x % 2 == 0}
 print(f"Even set: {even_set}")
 
 # Generator Expression
-sum_of_squares = sum(x**2 for x in range(5))
+sum_of_squares = sum(x * x for x in range(5))  # x * x skips the generic pow()
 print(f"Sum of squares: {sum_of_squares}")
\ No newline at end of file
@@ -24,26 +24,38 @@ positive_numbers = list(filter(lambda x: x > 0, [-2, -1, 0, 1, 2]))
 print(f"Filtered even numbers: {even_numbers}")
 print(f"Filtered positive numbers: {positive_numbers}")
 
+# Comprehension Equivalents (inline expression, no per-item call)
+doubled = [x * 2 for x in numbers]
+even_numbers = [x for x in numbers if x % 2 == 0]
+print(f"Comprehension doubled: {doubled}, evens: {even_numbers}")
+
 # Reduce Function
 from functools import reduce
-sum_all = reduce(lambda x, y: x + y, numbers)
-product_all = reduce(lambda x, y: x * y, numbers)
-print(f"Reduced sum: {sum_all}")
-print(f"Reduced product: {product_all}")
+from operator import or_
+merged = reduce(or_, [{'a': 1}, {'b': 2}, {'c': 3}])  # operator.or_ is C, no lambda frame
+print(f"Reduced merge: {merged}")
+
+# Built-in Reductions (no per-item function call)
+from math import prod
+sum_all = sum(numbers)
+product_all = prod(numbers)
+print(f"Built-in sum: {sum_all}")
+print(f"Built-in product: {product_all}")
 
 # -----------------------------
 # 2. DECORATOR PATTERNS
 # -----------------------------
 print("\n=== Decorator Patterns ===")
 
+from time import perf_counter_ns
+
 # Function Decorator
 def timer_decorator(func):
-    from time import time
     def wrapper(*args, **kwargs):
-        start = time()
+        start = perf_counter_ns()  # Monotonic integer clock
         result = func(*args, **kwargs)
-        end = time()
-        print(f"Function {func.__name__} took {end-start:.4f} seconds")
+        end = perf_counter_ns()
+        print(f"Function {func.__name__} took {(end - start) / 1e9:.4f} seconds")
         return result
     return wrapper
 
@@ -79,6 +91,8 @@ print("\n=== Iterator Patterns ===")
 
 # Custom Iterator
 class CountDown:
+    __slots__ = ('start',)
+
     def __init__(self, start):
         self.start = start
 
@@ -91,6 +105,16 @@ class CountDown:
         self.start -= 1
         return self.start + 1
 
+# Iterable Delegating to a Built-in Iterator
+class CountDownRange:
+    __slots__ = ('start',)
+
+    def __init__(self, start):
+        self.start = start
+
+    def __iter__(self):
+        return iter(range(self.start, 0, -1))  # Steps run in C
+
 # Generator Functions
 def fibonacci_generator(n):
     a, b = 0, 1
@@ -98,6 +122,15 @@ def fibonacci_generator(n):
         yield a
         a, b = b, a + b
 
+# Preallocated List (when every value is consumed anyway)
+def fibonacci_list(n):
+    result = [0] * n
+    a, b = 0, 1
+    for i in range(n):
+        result[i] = a
+        a, b = b, a + b
+    return result
+
 def infinite_counter():
     num = 0
     while True:
@@ -130,10 +163,10 @@ class FileManager:
 
 # Context Manager Using Decorator
 from contextlib import contextmanager
+from time import time  # Import once, not on every timer() call
 
 @contextmanager
 def timer():
-    from time import time
     start = time()
     yield
     end = time()
@@ -160,17 +193,23 @@ def temporary_attribute(obj, name, value):
 # -----------------------------
 print("\n=== Metaclass Patterns ===")
 
+from functools import wraps
+
+LOGGING_ENABLED = True  # Checked once per class, not per call
+
 # Basic Metaclass
 class MetaLogger(type):
     def __new__(cls, name, bases, attrs):
         # Add logging to all methods
-        for key, value in attrs.items():
-            if callable(value):
-                attrs[key] = cls.log_call(value)
+        if LOGGING_ENABLED:
+            for key, value in attrs.items():
+                if callable(value):
+                    attrs[key] = cls.log_call(value)
         return super().__new__(cls, name, bases, attrs)
     
     @staticmethod
     def log_call(func):
+        @wraps(func)
         def wrapper(*args, **kwargs):
             print(f"Calling {func.__name__}")
             return func(*args, **kwargs)
@@ -193,11 +232,16 @@ class AbstractShape(ABC):
 # -----------------------------
 print("\n=== Descriptor Patterns ===")
 
+import sys
+
 # Data Descriptor
 class ValidString:
+    __slots__ = ('minsize', 'maxsize', 'name', '_upper')
+    
     def __init__(self, minsize=0, maxsize=None):
         self.minsize = minsize
         self.maxsize = maxsize
+        self._upper = maxsize or sys.maxsize  # No maxsize means unbounded
         
     def __get__(self, instance, owner):
         if instance is None:
@@ -207,17 +251,20 @@ class ValidString:
     def __set__(self, instance, value):
         if not isinstance(value, str):
             raise TypeError("Value must be a string")
-        if len(value) < self.minsize:
-            raise ValueError(f"String must be at least {self.minsize} chars")
-        if self.maxsize and len(value) > self.maxsize:
+        size = len(value)
+        if not self.minsize <= size <= self._upper:
+            if size < self.minsize:
+                raise ValueError(f"String must be at least {self.minsize} chars")
             raise ValueError(f"String must be at most {self.maxsize} chars")
         instance.__dict__[self.name] = value
     
     def __set_name__(self, owner, name):
-        self.name = name
+        self.name = sys.intern(name)
 
 # Property Decorator
 class Temperature:
+    __slots__ = ('_celsius', '__weakref__')
+    
     def __init__(self, celsius):
         self._celsius = celsius
     
@@ -233,21 +280,22 @@ class Temperature:
     
     @property
     def fahrenheit(self):
-        return (self.celsius * 9/5) + 32
+        return self._celsius * 9 / 5 + 32  # Read the slot, skip the getter
     
     @fahrenheit.setter
     def fahrenheit(self, value):
         self.celsius = (value - 32) * 5/9
+    
+    @staticmethod
+    def batch_fahrenheit(celsius_values):
+        return [c * 9 / 5 + 32 for c in celsius_values]
 
 # -----------------------------
 # 7. ADVANCED COLLECTIONS
 # -----------------------------
 print("\n=== Advanced Collections ===")
 
-from collections import (
-    Counter, defaultdict, deque, 
-    ChainMap, OrderedDict, namedtuple
-)
+from collections import Counter, defaultdict, deque, ChainMap
 
 # Counter Examples
 inventory = Counter(['apple', 'banana', 'apple', 'orange'])
@@ -255,9 +303,19 @@ print(f"Item count: {inventory}")
 print(f"Most common: {inventory.most_common(2)}")
 
 # defaultdict Examples
-tree = lambda: defaultdict(tree)
-filesystem = tree()
-filesystem['user']['documents']['python']['script.py'] = 'content'
+by_letter = defaultdict(list)
+for fruit in ['apple', 'avocado', 'banana']:
+    by_letter[fruit[0]].append(fruit)
+
+# Nested Paths with setdefault
+def set_path(root, keys, value):
+    node = root
+    for key in keys[:-1]:
+        node = node.setdefault(key, {})
+    node[keys[-1]] = value
+
+filesystem = {}
+set_path(filesystem, ('user', 'documents', 'python', 'script.py'), 'content')
 
 # deque Examples
 history = deque(maxlen=3)
@@ -270,11 +328,11 @@ defaults = {'theme': 'dark', 'language': 'en'}
 user_settings = {'language': 'fr'}
 settings = ChainMap(user_settings, defaults)
 
-# OrderedDict Examples
-od = OrderedDict()
+# Ordered dict Examples (plain dicts keep insertion order since 3.7)
+od = {}
 od['first'] = 1
 od['second'] = 2
-od.move_to_end('first')
+od['first'] = od.pop('first')  # Move to end
 
 # -----------------------------
 # 8. ADVANCED COMPREHENSIONS
@@ -282,21 +340,43 @@ od.move_to_end('first')
 print("\n=== Advanced Comprehensions ===")
 
 # Nested Dictionary Comprehension
-matrix = {{f"pos_{i}_{j}": i * j 
-          for j in range(3)} 
-          for i in range(3)}
+grid = {f"row_{i}": {f"pos_{i}_{j}": i * j
+                     for j in range(3)}
+        for i in range(3)}
 
 # Conditional Comprehensions
 numbers = [-4, -2, 0, 2, 4]
-abs_even = [x for x in numbers if x % 2 == 0 if x < 0]
+abs_even = [x for x in numbers if x < 0 if x % 2 == 0]  # Cheapest test first
 
 # Nested List Comprehension
-matrix = [[1, 2, 3], [4, 5, 6], [7, 8, 9]]
-transposed = [[row[i] for row in matrix] for i in range(3)]
+from itertools import chain
+matrix = ((1, 2, 3), (4, 5, 6), (7, 8, 9))  # Folded into one constant
+transposed = [list(column) for column in zip(*matrix)]  # zip gathers columns in C
+flattened = list(chain.from_iterable(matrix))
 
 # Set Comprehensions with Functions
-def is_prime(n):
+from functools import lru_cache
+
+def prime_sieve(limit):
+    # Sieve of Eratosthenes: slice assignment clears multiples in C
+    sieve = bytearray([1]) * limit
+    sieve[:2] = bytes(min(limit, 2))
+    for i in range(2, int(limit ** 0.5) + 1):
+        if sieve[i]:
+            sieve[i*i::i] = bytes(len(range(i*i, limit, i)))
+    return sieve
+
+_PRIME_TABLE = prime_sieve(100)
+
+@lru_cache(maxsize=4096)
+def trial_division(n):
     return n > 1 and all(n % i != 0 for i in range(2, int(n ** 0.5) + 1))
+
+def is_prime(n):
+    # Table lookup for small ints, cached trial division for everything else
+    if isinstance(n, int) and 0 <= n < len(_PRIME_TABLE):
+        return bool(_PRIME_TABLE[n])
+    return trial_division(n)
 primes = {x for x in range(100) if is_prime(x)}
 
 # -----------------------------
@@ -323,11 +403,13 @@ def enforce_types(*types, **typed_args):
             # Check positional args
             for arg, type_ in zip(args, types):
                 assert isinstance(arg, type_), f"Argument {arg} must be {type_}"
-            # Check keyword args
-            for key, value in kwargs.items():
-                if key in typed_args:
-                    assert isinstance(value, typed_args[key]), \
-                        f"Argument {key} must be {typed_args[key]}"
+            # Check keyword args (one lookup per kwarg)
+            if typed_args:
+                for key, value in kwargs.items():
+                    type_ = typed_args.get(key)
+                    if type_ is not None:
+                        assert isinstance(value, type_), \
+                            f"Argument {key} must be {type_}"
             return func(*args, **kwargs)
         return wrapper
     return decorator